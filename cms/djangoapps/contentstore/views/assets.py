@@ -1,6 +1,10 @@
+import base64
+import calendar
 import json
 import logging
 import math
+import re
+from datetime import datetime, timedelta
 from functools import partial
 
 from django.conf import settings
@@ -12,6 +16,7 @@ from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_http_methods, require_POST
 from opaque_keys.edx.keys import AssetKey, CourseKey
 from pymongo import ASCENDING, DESCENDING
+from pytz import UTC
 
 from contentstore.utils import reverse_course_url
 from contentstore.views.exception import AssetNotFoundException
@@ -47,6 +52,11 @@ def assets_handler(request, course_key_string=None, asset_key_string=None):
             page_size: the number of items per page (defaults to 50)
             sort: the asset field to sort by (defaults to "date_added")
             direction: the sort direction (defaults to "descending")
+            after: the "nextCursor" of a previous response sorted by "date_added". When given, the
+                page following that cursor is returned instead of the requested page, which
+                avoids skipping over all of the preceding assets in the database. The response reports
+                the same start and page as the equivalent offset request, but its totalCount is null
+                as counting the assets would cost as much as skipping over them.
     POST
         json: create (or update?) an asset. The only updating that can be done is changing the lock state.
     PUT
@@ -103,21 +113,15 @@ def _assets_json(request, course_key):
     filter_params = None
     if requested_filter:
         if requested_filter == 'OTHER':
-            all_filters = settings.FILES_AND_UPLOAD_TYPE_FILTERS
-            where = []
-            for all_filter in all_filters:
-                extension_filters = all_filters[all_filter]
-                where.extend(
-                    ["JSON.stringify(this.contentType).toUpperCase() != JSON.stringify('{}').toUpperCase()".format(
-                        extension_filter) for extension_filter in extension_filters])
+            all_file_types = []
+            for file_types in settings.FILES_AND_UPLOAD_TYPE_FILTERS.values():
+                all_file_types.extend(file_types)
             filter_params = {
-                "$where": ' && '.join(where),
+                "contentType": {"$nin": _get_content_type_patterns(all_file_types)},
             }
         else:
-            where = ["JSON.stringify(this.contentType).toUpperCase() == JSON.stringify('{}').toUpperCase()".format(
-                req_filter) for req_filter in requested_file_types]
             filter_params = {
-                "$where": ' || '.join(where),
+                "contentType": {"$in": _get_content_type_patterns(requested_file_types)},
             }
 
     sort_direction = DESCENDING
@@ -130,26 +134,53 @@ def _assets_json(request, course_key):
     elif requested_sort == 'display_name':
         requested_sort = 'displayname'
     sort = [(requested_sort, sort_direction)]
-
-    current_page = max(requested_page, 0)
-    start = current_page * requested_page_size
-    options = {
-        'current_page': current_page,
-        'page_size': requested_page_size,
-        'sort': sort,
-        'filter_params': filter_params
-    }
-    assets, total_count = _get_assets_for_page(request, course_key, options)
-    end = start + len(assets)
-
-    # If the query is beyond the final page, then re-query the final page so
-    # that at least one asset is returned
-    if requested_page > 0 and start >= total_count:
-        options['current_page'] = current_page = int(math.floor((total_count - 1) / requested_page_size))
+    if requested_sort == 'uploadDate':
+        # Break ties on the filename, which is unique within a course, so that the order
+        # and so the cursors are stable
+        sort.append(('filename', sort_direction))
+
+    requested_cursor = request.GET.get('after')
+    if requested_cursor:
+        if requested_sort != 'uploadDate' or requested_page_size < 1:
+            return HttpResponseBadRequest()
+        try:
+            cursor_params, start = _parse_cursor(requested_cursor, sort_direction)
+        except (OverflowError, TypeError, ValueError):
+            return HttpResponseBadRequest()
+        assets, total_count = contentstore().get_all_content_for_course(
+            course_key,
+            maxresults=requested_page_size,
+            sort=sort,
+            filter_params={'$and': [filter_params, cursor_params]} if filter_params else cursor_params,
+            include_count=False,
+        )
+        current_page = start // requested_page_size
+        end = start + len(assets)
+    else:
+        current_page = max(requested_page, 0)
         start = current_page * requested_page_size
+        options = {
+            'current_page': current_page,
+            'page_size': requested_page_size,
+            'sort': sort,
+            'filter_params': filter_params
+        }
         assets, total_count = _get_assets_for_page(request, course_key, options)
         end = start + len(assets)
 
+        # If the query is beyond the final page, then re-query the final page so
+        # that at least one asset is returned
+        if requested_page > 0 and start >= total_count:
+            options['current_page'] = current_page = int(math.floor((total_count - 1) / requested_page_size))
+            start = current_page * requested_page_size
+            assets, total_count = _get_assets_for_page(request, course_key, options)
+            end = start + len(assets)
+
+    next_cursor = None
+    has_more_assets = total_count is None or end < total_count
+    if requested_sort == 'uploadDate' and assets and len(assets) == requested_page_size and has_more_assets:
+        next_cursor = _get_next_cursor(assets[-1], end)
+
     asset_json = []
     for asset in assets:
         asset_location = asset['asset_key']
@@ -178,9 +209,54 @@ def _assets_json(request, course_key):
         'totalCount': total_count,
         'assets': asset_json,
         'sort': requested_sort,
+        'nextCursor': next_cursor,
     })
 
 
+def _get_next_cursor(last_asset, next_start):
+    """
+    Returns an opaque cursor pointing just past the given asset, the last of a page sorted by upload date.
+
+    The cursor holds the upload date and filename of that asset, which together are unique, along with
+    the index of the first asset of the next page so that responses can still report their position.
+    """
+    upload_date = last_asset['uploadDate']
+    timestamp = calendar.timegm(upload_date.utctimetuple()) * 1000 + upload_date.microsecond // 1000
+    return base64.urlsafe_b64encode(json.dumps([timestamp, last_asset['filename'], next_start]))
+
+
+def _parse_cursor(cursor, sort_direction):
+    """
+    Returns the Mongo query for the assets following the given cursor in the given sort direction,
+    along with the index of the first of those assets.
+
+    Raises OverflowError, TypeError or ValueError if the cursor is malformed.
+    """
+    timestamp, filename, start = json.loads(base64.urlsafe_b64decode(str(cursor)))
+    if not (
+            isinstance(timestamp, (int, long)) and isinstance(filename, basestring) and
+            isinstance(start, (int, long)) and start >= 0
+    ):
+        raise ValueError('Invalid assets cursor: {}'.format(cursor))
+    upload_date = datetime(1970, 1, 1, tzinfo=UTC) + timedelta(milliseconds=timestamp)
+    operator = '$gt' if sort_direction == ASCENDING else '$lt'
+    cursor_params = {
+        '$or': [
+            {'uploadDate': {operator: upload_date}},
+            {'uploadDate': upload_date, 'filename': {operator: filename}},
+        ]
+    }
+    return cursor_params, start
+
+
+def _get_content_type_patterns(content_types):
+    """
+    Returns case-insensitive, exact-match patterns for the given content types, so that
+    the asset filters are evaluated natively by Mongo rather than by a per-document `$where`.
+    """
+    return [re.compile(u'^{}$'.format(re.escape(content_type)), re.IGNORECASE) for content_type in content_types]
+
+
 def _get_assets_for_page(request, course_key, options):
     """
     Returns the list of assets for the specified page and page size.
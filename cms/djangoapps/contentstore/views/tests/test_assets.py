@@ -1,9 +1,12 @@
 """
 Unit tests for the asset upload endpoint.
 """
+import base64
 import json
 from datetime import datetime
+from functools import partial
 from io import BytesIO
+from operator import itemgetter
 
 import mock
 from ddt import data, ddt
@@ -12,28 +15,97 @@ from django.test.utils import override_settings
 from mock import patch
 from opaque_keys.edx.locations import AssetLocation, SlashSeparatedCourseKey
 from PIL import Image
+from pymongo import DESCENDING
 from pytz import UTC
 
-from contentstore.tests.utils import CourseTestCase
+from contentstore.tests.utils import AjaxEnabledTestClient, CourseTestCase
 from contentstore.utils import reverse_course_url
 from contentstore.views import assets
 from static_replace import replace_static_urls
+from student.tests.factories import UserFactory
 from xmodule.assetstore import AssetMetadata
 from xmodule.contentstore.content import StaticContent
 from xmodule.contentstore.django import contentstore
 from xmodule.modulestore import ModuleStoreEnum
 from xmodule.modulestore.django import modulestore
+from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
 from xmodule.modulestore.xml_importer import import_course_from_xml
 
 TEST_DATA_DIR = settings.COMMON_TEST_DATA_ROOT
 
 MAX_FILE_SIZE = settings.MAX_ASSET_UPLOAD_FILE_SIZE_IN_MB * 1000 ** 2
 
-FEATURES_WITH_CERTS_ENABLED = settings.FEATURES.copy()
-FEATURES_WITH_CERTS_ENABLED['CERTIFICATES_HTML_VIEW'] = True
+SAMPLE_ASSET_EXTENSIONS = {'text': 'txt', 'image': 'jpg', 'opendoc': 'odt'}
+SAMPLE_FILE_CONTENTS = b"This file is generated by python unit test"
 
 
-@override_settings(FEATURES=FEATURES_WITH_CERTS_ENABLED)
+def _generate_sample_image():
+    """
+    Returns the bytes of a small jpeg image, encoded once for all the tests in this module.
+    """
+    image_file = BytesIO()
+    Image.new("RGB", size=(50, 50), color=(255, 0, 0)).save(image_file, 'jpeg')
+    return image_file.getvalue()
+
+
+SAMPLE_IMAGE_CONTENTS = _generate_sample_image()
+
+
+FAKE_QUERY_OPERATORS = {
+    '$lt': lambda value, operand: value < operand,
+    '$gt': lambda value, operand: value > operand,
+    '$in': lambda value, patterns: any(pattern.match(value) for pattern in patterns),
+    '$nin': lambda value, patterns: not any(pattern.match(value) for pattern in patterns),
+}
+
+
+def fake_asset_matches(asset, query):
+    """
+    Returns whether the asset dictionary matches the Mongo query. Only the operators
+    which the assets handler uses are supported, and `$in`/`$nin` only take patterns.
+    """
+    for field, condition in query.items():
+        if field == '$and':
+            matches = all(fake_asset_matches(asset, sub_query) for sub_query in condition)
+        elif field == '$or':
+            matches = any(fake_asset_matches(asset, sub_query) for sub_query in condition)
+        elif isinstance(condition, dict):
+            matches = all(
+                FAKE_QUERY_OPERATORS[operator](asset[field], operand) for operator, operand in condition.items()
+            )
+        else:
+            matches = asset[field] == condition
+        if not matches:
+            return False
+    return True
+
+
+def get_fake_assets_page(
+        fake_assets, course_key, start=0, maxresults=-1, sort=None, filter_params=None, include_count=True
+):  # pylint: disable=unused-argument
+    """
+    Stands in for `get_all_content_for_course`, applying the filter, sort, skip and limit
+    to `fake_assets` the way the Mongo query would.
+    """
+    matching_assets = [asset for asset in fake_assets if fake_asset_matches(asset, filter_params or {})]
+    page = list(matching_assets)
+    for field, direction in reversed(sort or []):
+        page.sort(key=itemgetter(field), reverse=(direction == DESCENDING))
+    if maxresults > 0:
+        page = page[start:start + maxresults]
+    return page, len(matching_assets) if include_count else None
+
+
+def _get_features_with_certs_enabled():
+    """
+    Returns a copy of the FEATURES setting with the html certificates view enabled.
+    """
+    features = dict(settings.FEATURES)
+    features['CERTIFICATES_HTML_VIEW'] = True
+    return features
+
+
+@override_settings(FEATURES=_get_features_with_certs_enabled())
 class AssetsTestCase(CourseTestCase):
     """
     Parent class for all asset tests.
@@ -54,49 +126,46 @@ class AssetsTestCase(CourseTestCase):
         """
         Returns an in-memory file of the specified type with the given name for testing
         """
-        sample_asset = BytesIO()
-        sample_file_contents = "This file is generated by python unit test"
-        if asset_type == 'text':
-            sample_asset.name = '{name}.txt'.format(name=name)
-            sample_asset.write(sample_file_contents)
-        elif asset_type == 'image':
-            image = Image.new("RGB", size=(50, 50), color=(256, 0, 0))
-            image.save(sample_asset, 'jpeg')
-            sample_asset.name = '{name}.jpg'.format(name=name)
-        elif asset_type == 'opendoc':
-            sample_asset.name = '{name}.odt'.format(name=name)
-            sample_asset.write(sample_file_contents)
-        sample_asset.seek(0)
+        if asset_type == 'image':
+            sample_asset = BytesIO(SAMPLE_IMAGE_CONTENTS)
+        else:
+            sample_asset = BytesIO(SAMPLE_FILE_CONTENTS)
+        sample_asset.name = '{name}.{ext}'.format(name=name, ext=SAMPLE_ASSET_EXTENSIONS[asset_type])
         return sample_asset
 
 
-class BasicAssetsTestCase(AssetsTestCase):
+@override_settings(FEATURES=_get_features_with_certs_enabled())
+class ToyCourseAssetsTestCase(SharedModuleStoreTestCase):
     """
-    Test getting assets via html w/o additional args
+    Tests for the assets of the toy course, which is imported once for all of them
+    rather than once per test.
     """
-    def test_basic(self):
-        resp = self.client.get(self.url, HTTP_ACCEPT='text/html')
-        self.assertEquals(resp.status_code, 200)
-
-    def test_static_url_generation(self):
-
-        course_key = SlashSeparatedCourseKey('org', 'class', 'run')
-        location = course_key.make_asset_key('asset', 'my_file_name.jpg')
-        path = StaticContent.get_static_path_from_location(location)
-        self.assertEquals(path, '/static/my_file_name.jpg')
-
-    def test_pdf_asset(self):
-        module_store = modulestore()
-        course_items = import_course_from_xml(
-            module_store,
-            self.user.id,
+    @classmethod
+    def setUpClass(cls):
+        super(ToyCourseAssetsTestCase, cls).setUpClass()
+        cls.toy_course = import_course_from_xml(
+            cls.store,
+            ModuleStoreEnum.UserID.test,
             TEST_DATA_DIR,
             ['toy'],
             static_content_store=contentstore(),
             verbose=True
-        )
-        course = course_items[0]
-        url = reverse_course_url('assets_handler', course.id)
+        )[0]
+        cls.sample_asset_location = StaticContent.get_location_from_path('/c4x/edX/toy/asset/sample_static.html')
+
+    @classmethod
+    def setUpTestData(cls):
+        super(ToyCourseAssetsTestCase, cls).setUpTestData()
+        cls.password = 'test'
+        cls.user = UserFactory(is_staff=True, password=cls.password)
+
+    def setUp(self):
+        super(ToyCourseAssetsTestCase, self).setUp()
+        self.client = AjaxEnabledTestClient()
+        self.client.login(username=self.user.username, password=self.password)
+
+    def test_pdf_asset(self):
+        url = reverse_course_url('assets_handler', self.toy_course.id)
 
         # Test valid contentType for pdf asset (textbook.pdf)
         resp = self.client.get(url, HTTP_ACCEPT='application/json')
@@ -108,6 +177,64 @@ class BasicAssetsTestCase(AssetsTestCase):
         # Note: Actual contentType for textbook.pdf in asset.json is 'text/pdf'
         self.assertEqual(content.content_type, 'application/pdf')
 
+    def test_locking(self):
+        """
+        Tests a simple locking and unlocking of an asset in the toy course.
+        """
+        def verify_asset_locked_state(locked):
+            """ Helper method to verify lock state in the contentstore """
+            content = contentstore().find(self.sample_asset_location)
+            self.assertEqual(content.locked, locked)
+
+        def post_asset_update(lock, course):
+            """ Helper method for posting asset update. """
+            content_type = 'application/txt'
+            upload_date = datetime(2013, 6, 1, 10, 30, tzinfo=UTC)
+            asset_location = course.id.make_asset_key('asset', 'sample_static.html')
+            url = reverse_course_url('assets_handler', course.id, kwargs={'asset_key_string': unicode(asset_location)})
+
+            resp = self.client.post(
+                url,
+                # pylint: disable=protected-access
+                json.dumps(assets._get_asset_json(
+                    "sample_static.html", content_type, upload_date, asset_location, None, lock)),
+                "application/json"
+            )
+
+            self.assertEqual(resp.status_code, 201)
+            return json.loads(resp.content)
+
+        course = self.toy_course
+        # The toy course is shared with the other tests in this class, so always leave the asset unlocked.
+        self.addCleanup(contentstore().set_attr, self.sample_asset_location, 'locked', False)
+        verify_asset_locked_state(False)
+
+        # Lock the asset
+        resp_asset = post_asset_update(True, course)
+        self.assertTrue(resp_asset['locked'])
+        verify_asset_locked_state(True)
+
+        # Unlock the asset
+        resp_asset = post_asset_update(False, course)
+        self.assertFalse(resp_asset['locked'])
+        verify_asset_locked_state(False)
+
+
+class BasicAssetsTestCase(AssetsTestCase):
+    """
+    Test getting assets via html w/o additional args
+    """
+    def test_basic(self):
+        resp = self.client.get(self.url, HTTP_ACCEPT='text/html')
+        self.assertEquals(resp.status_code, 200)
+
+    def test_static_url_generation(self):
+
+        course_key = SlashSeparatedCourseKey('org', 'class', 'run')
+        location = course_key.make_asset_key('asset', 'my_file_name.jpg')
+        path = StaticContent.get_static_path_from_location(location)
+        self.assertEquals(path, '/static/my_file_name.jpg')
+
     def test_relative_url_for_split_course(self):
         """
         Test relative path for split courses assets
@@ -147,40 +274,213 @@ class BasicAssetsTestCase(AssetsTestCase):
             self.assertEquals(resp.status_code, 200)
 
 
+@ddt
 class PaginationTestCase(AssetsTestCase):
     """
     Tests the pagination of assets returned from the REST API.
     """
+    @classmethod
+    def setUpClass(cls):
+        super(PaginationTestCase, cls).setUpClass()
+        cls.file_types_by_filter = {
+            filter_value: frozenset(file_types)
+            for filter_value, file_types in settings.FILES_AND_UPLOAD_TYPE_FILTERS.items()
+        }
+        cls.all_file_types = frozenset().union(*cls.file_types_by_filter.values())
+
     def test_json_responses(self):
         """
-        Test the ajax asset interfaces
+        Test the paging of the ajax asset interfaces
+        """
+        with self.patch_contentstore_assets(4):
+            for query, expected_start, expected_length in (
+                    # Valid page requests
+                    ("", 0, 4),
+                    ("?page_size=2", 0, 2),
+                    ("?page_size=2&page=1", 2, 2),
+                    # Querying outside the range of valid pages
+                    ("?page_size=2&page=-1", 0, 2),
+                    ("?page_size=2&page=2", 2, 2),
+                    ("?page_size=3&page=1", 3, 1),
+            ):
+                self.assert_correct_asset_response(self.url + query, expected_start, expected_length, 4)
+
+    def test_sorted_responses(self):
+        """
+        Test the sorting of the ajax asset interfaces
+        """
+        with self.patch_contentstore_assets(4):
+            for sort in ('date_added', 'display_name'):
+                for direction in ('asc', 'desc'):
+                    self.assert_correct_sort_response(self.url, sort, direction)
+
+    def test_filtered_responses(self):
+        """
+        Test the filtering of the ajax asset interfaces against assets stored in the contentstore
         """
         self.upload_asset("asset-1")
         self.upload_asset("asset-2")
         self.upload_asset("asset-3")
         self.upload_asset("asset-4", "opendoc")
 
-        # Verify valid page requests
-        self.assert_correct_asset_response(self.url, 0, 4, 4)
-        self.assert_correct_asset_response(self.url + "?page_size=2", 0, 2, 4)
-        self.assert_correct_asset_response(
-            self.url + "?page_size=2&page=1", 2, 2, 4)
-        self.assert_correct_sort_response(self.url, 'date_added', 'asc')
-        self.assert_correct_sort_response(self.url, 'date_added', 'desc')
-        self.assert_correct_sort_response(self.url, 'display_name', 'asc')
-        self.assert_correct_sort_response(self.url, 'display_name', 'desc')
         self.assert_correct_filter_response(self.url, 'asset_type', '')
         self.assert_correct_filter_response(self.url, 'asset_type', 'OTHER')
         self.assert_correct_filter_response(
             self.url, 'asset_type', 'Documents')
 
-        # Verify querying outside the range of valid pages
-        self.assert_correct_asset_response(
-            self.url + "?page_size=2&page=-1", 0, 2, 4)
-        self.assert_correct_asset_response(
-            self.url + "?page_size=2&page=2", 2, 2, 4)
-        self.assert_correct_asset_response(
-            self.url + "?page_size=3&page=1", 3, 1, 4)
+    def test_cursor_responses(self):
+        """
+        Test paging through the assets with the cursor returned by the ajax asset interfaces
+        """
+        self.upload_asset("asset-1")
+        self.upload_asset("asset-2")
+        self.upload_asset("asset-3")
+
+        json_responses = self.get_all_pages(self.url + '?page_size=2')
+        self.assertEquals([len(json_response['assets']) for json_response in json_responses], [2, 1])
+        self.assert_correct_cursor_pages(json_responses, 2, ['asset-1.txt', 'asset-2.txt', 'asset-3.txt'])
+
+    @data('asc', 'desc')
+    def test_cursor_responses_with_same_upload_date(self, direction):
+        """
+        Test that the cursors neither skip nor repeat assets uploaded at the same time,
+        even when there are more of them than fit on a page
+        """
+        with self.patch_contentstore_assets(5, same_upload_date=True):
+            json_responses = self.get_all_pages(self.url + '?page_size=2&direction=' + direction)
+        self.assertEquals(len(json_responses), 3)
+        self.assert_correct_cursor_pages(
+            json_responses, 2, ['asset-1.txt', 'asset-2.txt', 'asset-3.txt', 'asset-4.txt', 'asset-5.odt']
+        )
+
+    @data('asc', 'desc')
+    def test_filtered_cursor_responses(self, direction):
+        """
+        Test that the cursors combine with the asset type filter
+        """
+        with self.patch_contentstore_assets(5) as mock_get_all_content_for_course:
+            json_responses = self.get_all_pages(self.url + '?page_size=2&asset_type=Documents&direction=' + direction)
+            # Pages after the first are queried once, with both the filter and the cursor and without a count
+            cursor_calls = mock_get_all_content_for_course.call_args_list[1:]
+        # The second page is full, so only the empty third page shows that there are no more assets
+        self.assertEquals([len(json_response['assets']) for json_response in json_responses], [2, 2, 0])
+        self.assert_correct_cursor_pages(
+            json_responses, 2, ['asset-1.txt', 'asset-2.txt', 'asset-3.txt', 'asset-4.txt']
+        )
+        self.assertEquals(len(cursor_calls), 2)
+        for cursor_call in cursor_calls:
+            type_filter, cursor_filter = cursor_call[1]['filter_params']['$and']
+            self.assertIn('$in', type_filter['contentType'])
+            self.assertIn('$or', cursor_filter)
+            self.assertFalse(cursor_call[1]['include_count'])
+
+        first_page_asset_names = [asset['display_name'] for asset in json_responses[0]['assets']]
+        expected_first_names = ['asset-1.txt', 'asset-2.txt'] if direction == 'asc' else ['asset-4.txt', 'asset-3.txt']
+        self.assertEquals(first_page_asset_names, expected_first_names)
+
+    def test_invalid_cursor(self):
+        """
+        Test that malformed cursors, and cursors used with a sort other than the upload date, are rejected
+        """
+        resp = self.client.get(self.url + '?after=not-a-cursor', HTTP_ACCEPT='application/json')
+        self.assertEquals(resp.status_code, 400)
+        resp = self.client.get(self.url + '?sort=display_name&after=WzAsIFtdXQ==', HTTP_ACCEPT='application/json')
+        self.assertEquals(resp.status_code, 400)
+        for cursor in (
+                [0, 'asset-1.txt'],  # Missing the start index
+                [10 ** 20, 'asset-1.txt', 0],  # Timestamp too large for a datetime
+                [0, 5, 0],  # Filename which is not a string
+                [0, {}, 0],
+                [0, 'asset-1.txt', -1],  # Negative start index
+        ):
+            resp = self.client.get(
+                self.url + '?after=' + base64.urlsafe_b64encode(json.dumps(cursor)), HTTP_ACCEPT='application/json'
+            )
+            self.assertEquals(resp.status_code, 400)
+
+    @mock.patch('xmodule.contentstore.mongo.MongoContentStore.get_all_content_for_course')
+    def test_filter_params(self, mock_get_all_content_for_course):
+        """
+        Test that asset type filters are passed to the contentstore as native queries on the content type
+        """
+        mock_get_all_content_for_course.return_value = [], 0
+        self.client.get(self.url + '?asset_type=Documents', HTTP_ACCEPT='application/json')
+        filter_params = mock_get_all_content_for_course.call_args[1]['filter_params']
+        patterns = filter_params['contentType']['$in']
+        self.assertTrue(any(pattern.match('TEXT/PLAIN') for pattern in patterns))
+        self.assertFalse(any(pattern.match('text/plainer') for pattern in patterns))
+
+        self.client.get(self.url + '?asset_type=OTHER', HTTP_ACCEPT='application/json')
+        filter_params = mock_get_all_content_for_course.call_args[1]['filter_params']
+        patterns = filter_params['contentType']['$nin']
+        self.assertTrue(any(pattern.match('image/png') for pattern in patterns))
+        self.assertTrue(any(pattern.match('application/pdf') for pattern in patterns))
+
+    def patch_contentstore_assets(self, count, same_upload_date=False):
+        """
+        Returns a patch of the contentstore which pages through `count` fake assets of this course.
+        """
+        return mock.patch(
+            'xmodule.contentstore.mongo.MongoContentStore.get_all_content_for_course',
+            side_effect=partial(get_fake_assets_page, self.get_fake_assets(count, same_upload_date)),
+        )
+
+    def get_fake_assets(self, count, same_upload_date=False):
+        """
+        Returns `count` asset dictionaries in the format returned by the contentstore.
+        The last one is an opendoc file, the others are text files. Unless `same_upload_date`
+        is set, they were uploaded a minute apart.
+        """
+        fake_assets = []
+        for index in range(count):
+            if index == count - 1:
+                name, content_type = 'asset-{}.odt', 'application/vnd.oasis.opendocument.text'
+            else:
+                name, content_type = 'asset-{}.txt', 'text/plain'
+            name = name.format(index + 1)
+            asset_key = self.course.id.make_asset_key(AssetMetadata.GENERAL_ASSET_TYPE, name)
+            fake_assets.append({
+                "filename": unicode(asset_key),
+                "asset_key": asset_key,
+                "displayname": name,
+                "contentType": content_type,
+                "uploadDate": datetime(2015, 1, 12, 10, 30 if same_upload_date else 30 + index, tzinfo=UTC),
+                "thumbnail_location": None,
+                "locked": None
+            })
+        return fake_assets
+
+    def get_all_pages(self, url):
+        """
+        Follows the cursors returned by the ajax asset interfaces from the given url, and returns
+        the responses of all of the pages. Fails rather than looping if the cursors never end.
+        """
+        json_responses = []
+        cursor_url = url
+        while cursor_url:
+            self.assertLess(len(json_responses), 10, "Cursors did not reach the end of the assets")
+            resp = self.client.get(cursor_url, HTTP_ACCEPT='application/json')
+            self.assertEquals(resp.status_code, 200)
+            json_responses.append(json.loads(resp.content))
+            next_cursor = json_responses[-1]['nextCursor']
+            cursor_url = url + '&after=' + str(next_cursor) if next_cursor else None
+        return json_responses
+
+    def assert_correct_cursor_pages(self, json_responses, page_size, expected_names):
+        """
+        Ensures that the pages returned by following the cursors contain each expected asset
+        exactly once, and report the same positions as offset paging would. Only the first page,
+        which is requested by offset, is counted.
+        """
+        seen_names = []
+        for page, json_response in enumerate(json_responses):
+            self.assertEquals(json_response['page'], page)
+            self.assertEquals(json_response['start'], page * page_size)
+            self.assertEquals(json_response['end'], page * page_size + len(json_response['assets']))
+            self.assertEquals(json_response['totalCount'], len(expected_names) if page == 0 else None)
+            seen_names.extend(asset['display_name'] for asset in json_response['assets'])
+        self.assertEquals(len(seen_names), len(expected_names))
+        self.assertItemsEqual(seen_names, expected_names)
 
     @mock.patch('xmodule.contentstore.mongo.MongoContentStore.get_all_content_for_course')
     def test_mocked_filtered_response(self, mock_get_all_content_for_course):
@@ -211,7 +511,7 @@ class PaginationTestCase(AssetsTestCase):
             1
         ]
         # Verify valid page requests
-        self.assert_correct_filter_response(self.url, 'asset_type', 'OTHER')
+        self.assert_correct_filter_response(self.url, 'asset_type', 'Images')
 
     def assert_correct_asset_response(self, url, expected_start, expected_length, expected_total):
         """
@@ -246,24 +546,17 @@ class PaginationTestCase(AssetsTestCase):
         """
         Get from the url w/ a filter option and ensure items honor that filter
         """
-        requested_file_types = settings.FILES_AND_UPLOAD_TYPE_FILTERS.get(
-            filter_value, None)
         resp = self.client.get(
             url + '?' + filter_type + '=' + filter_value, HTTP_ACCEPT='application/json')
         json_response = json.loads(resp.content)
         assets_response = json_response['assets']
         if filter_value is not '':
-            content_types = [asset['content_type'].lower()
-                             for asset in assets_response]
+            content_types = set(asset['content_type'].lower() for asset in assets_response)
             if filter_value is 'OTHER':
-                all_file_type_extensions = []
-                for file_type in settings.FILES_AND_UPLOAD_TYPE_FILTERS:
-                    all_file_type_extensions.extend(file_type)
-                for content_type in content_types:
-                    self.assertNotIn(content_type, all_file_type_extensions)
+                unexpected_file_types = content_types & self.all_file_types
             else:
-                for content_type in content_types:
-                    self.assertIn(content_type, requested_file_types)
+                unexpected_file_types = content_types - self.file_types_by_filter[filter_value]
+            self.assertEqual(unexpected_file_types, set())
 
 
 @ddt
@@ -271,10 +564,6 @@ class UploadTestCase(AssetsTestCase):
     """
     Unit tests for uploading a file
     """
-    def setUp(self):
-        super(UploadTestCase, self).setUp()
-        self.url = reverse_course_url('assets_handler', self.course.id)
-
     def test_happy_path(self):
         resp = self.upload_asset()
         self.assertEquals(resp.status_code, 200)
@@ -312,7 +601,6 @@ class DownloadTestCase(AssetsTestCase):
     """
     def setUp(self):
         super(DownloadTestCase, self).setUp()
-        self.url = reverse_course_url('assets_handler', self.course.id)
         # First, upload something.
         self.asset_name = 'download_test'
         resp = self.upload_asset(self.asset_name)
@@ -368,63 +656,6 @@ class AssetToJsonTestCase(AssetsTestCase):
         self.assertIsNone(output["thumbnail"])
 
 
-class LockAssetTestCase(AssetsTestCase):
-    """
-    Unit test for locking and unlocking an asset.
-    """
-
-    def test_locking(self):
-        """
-        Tests a simple locking and unlocking of an asset in the toy course.
-        """
-        def verify_asset_locked_state(locked):
-            """ Helper method to verify lock state in the contentstore """
-            asset_location = StaticContent.get_location_from_path('/c4x/edX/toy/asset/sample_static.html')
-            content = contentstore().find(asset_location)
-            self.assertEqual(content.locked, locked)
-
-        def post_asset_update(lock, course):
-            """ Helper method for posting asset update. """
-            content_type = 'application/txt'
-            upload_date = datetime(2013, 6, 1, 10, 30, tzinfo=UTC)
-            asset_location = course.id.make_asset_key('asset', 'sample_static.html')
-            url = reverse_course_url('assets_handler', course.id, kwargs={'asset_key_string': unicode(asset_location)})
-
-            resp = self.client.post(
-                url,
-                # pylint: disable=protected-access
-                json.dumps(assets._get_asset_json(
-                    "sample_static.html", content_type, upload_date, asset_location, None, lock)),
-                "application/json"
-            )
-
-            self.assertEqual(resp.status_code, 201)
-            return json.loads(resp.content)
-
-        # Load the toy course.
-        module_store = modulestore()
-        course_items = import_course_from_xml(
-            module_store,
-            self.user.id,
-            TEST_DATA_DIR,
-            ['toy'],
-            static_content_store=contentstore(),
-            verbose=True
-        )
-        course = course_items[0]
-        verify_asset_locked_state(False)
-
-        # Lock the asset
-        resp_asset = post_asset_update(True, course)
-        self.assertTrue(resp_asset['locked'])
-        verify_asset_locked_state(True)
-
-        # Unlock the asset
-        resp_asset = post_asset_update(False, course)
-        self.assertFalse(resp_asset['locked'])
-        verify_asset_locked_state(False)
-
-
 class DeleteAssetTestCase(AssetsTestCase):
     """
     Unit test for removing an asset.
@@ -432,7 +663,6 @@ class DeleteAssetTestCase(AssetsTestCase):
     def setUp(self):
         """ Scaffolding """
         super(DeleteAssetTestCase, self).setUp()
-        self.url = reverse_course_url('assets_handler', self.course.id)
         # First, upload something.
         self.asset_name = 'delete_test'
         self.asset = self.get_sample_asset(self.asset_name)
@@ -442,7 +672,6 @@ class DeleteAssetTestCase(AssetsTestCase):
         self.uploaded_url = json.loads(response.content)['asset']['url']
 
         self.asset_location = AssetLocation.from_deprecated_string(self.uploaded_url)
-        self.content = contentstore().find(self.asset_location)
 
     def test_delete_asset(self):
         """ Tests the happy path :) """
@@ -491,7 +720,8 @@ class DeleteAssetTestCase(AssetsTestCase):
         """ Tests the sad path :( """
         test_url = reverse_course_url(
             'assets_handler', self.course.id, kwargs={'asset_key_string': unicode(self.uploaded_url)})
-        self.content.thumbnail_location = StaticContent.get_location_from_path('/c4x/edX/toy/asset/invalid')
-        contentstore().save(self.content)
+        content = contentstore().find(self.asset_location)
+        content.thumbnail_location = StaticContent.get_location_from_path('/c4x/edX/toy/asset/invalid')
+        contentstore().save(content)
         resp = self.client.delete(test_url, HTTP_ACCEPT="application/json")
         self.assertEquals(resp.status_code, 204)
@@ -358,10 +358,13 @@ class ContentStore(object):
     def find(self, filename):
         raise NotImplementedError
 
-    def get_all_content_for_course(self, course_key, start=0, maxresults=-1, sort=None, filter_params=None):
+    def get_all_content_for_course(
+            self, course_key, start=0, maxresults=-1, sort=None, filter_params=None, include_count=True
+    ):
         '''
         Returns a list of static assets for a course, followed by the total number of assets.
         By default all assets are returned, but start and maxresults can be provided to limit the query.
+        If include_count is False, the assets are not counted and None is returned in place of the total.
 
         The return format is a list of asset data dictionaries.
         The asset data dictionaries have the following keys:
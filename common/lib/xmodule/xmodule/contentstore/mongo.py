@@ -204,9 +204,12 @@ class MongoContentStore(ContentStore):
     def get_all_content_thumbnails_for_course(self, course_key):
         return self._get_all_content_for_course(course_key, get_thumbnails=True)[0]
 
-    def get_all_content_for_course(self, course_key, start=0, maxresults=-1, sort=None, filter_params=None):
+    def get_all_content_for_course(
+            self, course_key, start=0, maxresults=-1, sort=None, filter_params=None, include_count=True
+    ):
         return self._get_all_content_for_course(
-            course_key, start=start, maxresults=maxresults, get_thumbnails=False, sort=sort, filter_params=filter_params
+            course_key, start=start, maxresults=maxresults, get_thumbnails=False, sort=sort,
+            filter_params=filter_params, include_count=include_count
         )
 
     def remove_redundant_content_for_courses(self):
@@ -236,7 +239,8 @@ class MongoContentStore(ContentStore):
                                     start=0,
                                     maxresults=-1,
                                     sort=None,
-                                    filter_params=None):
+                                    filter_params=None,
+                                    include_count=True):
         '''
         Returns a list of all static assets for a course. The return format is a list of asset data dictionary elements.
 
@@ -258,7 +262,8 @@ class MongoContentStore(ContentStore):
             query.update(filter_params)
 
         items = self.fs_files.find(query, **find_args)
-        count = items.count()
+        # Counting walks every matching document, so callers paging by range can skip it
+        count = items.count() if include_count else None
         assets = list(items)
 
         # We're constructing the asset key immediately after retrieval from the database so that
@@ -431,16 +436,6 @@ class MongoContentStore(ContentStore):
             sparse=True,
             background=True
         )
-        create_collection_index(
-            self.fs_files,
-            [
-                ('content_son.org', pymongo.ASCENDING),
-                ('content_son.course', pymongo.ASCENDING),
-                ('uploadDate', pymongo.DESCENDING)
-            ],
-            sparse=True,
-            background=True
-        )
         create_collection_index(
             self.fs_files,
             [
@@ -466,7 +461,7 @@ class MongoContentStore(ContentStore):
             [
                 ('_id.org', pymongo.ASCENDING),
                 ('_id.course', pymongo.ASCENDING),
-                ('uploadDate', pymongo.ASCENDING)
+                ('display_name', pymongo.ASCENDING)
             ],
             sparse=True,
             background=True
@@ -474,19 +469,22 @@ class MongoContentStore(ContentStore):
         create_collection_index(
             self.fs_files,
             [
-                ('_id.org', pymongo.ASCENDING),
-                ('_id.course', pymongo.ASCENDING),
+                ('content_son.org', pymongo.ASCENDING),
+                ('content_son.course', pymongo.ASCENDING),
                 ('display_name', pymongo.ASCENDING)
             ],
             sparse=True,
             background=True
         )
+        # Needed by the assets handler, which pages through a course's assets sorted by `uploadDate`
+        # with ties broken on the per-course unique `filename`. Also serves sorts on `uploadDate` alone.
         create_collection_index(
             self.fs_files,
             [
-                ('content_son.org', pymongo.ASCENDING),
-                ('content_son.course', pymongo.ASCENDING),
-                ('uploadDate', pymongo.ASCENDING)
+                ('_id.org', pymongo.ASCENDING),
+                ('_id.course', pymongo.ASCENDING),
+                ('uploadDate', pymongo.ASCENDING),
+                ('filename', pymongo.ASCENDING)
             ],
             sparse=True,
             background=True
@@ -496,7 +494,8 @@ class MongoContentStore(ContentStore):
             [
                 ('content_son.org', pymongo.ASCENDING),
                 ('content_son.course', pymongo.ASCENDING),
-                ('display_name', pymongo.ASCENDING)
+                ('uploadDate', pymongo.ASCENDING),
+                ('filename', pymongo.ASCENDING)
             ],
             sparse=True,
             background=True
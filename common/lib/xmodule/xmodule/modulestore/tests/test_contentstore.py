@@ -160,6 +160,10 @@ class TestContentstore(unittest.TestCase):
         course1_assets, __ = self.contentstore.get_all_content_for_course(self.course1_key, 1, 1)
         self.assertEqual(len(course1_assets), 1, course1_assets)
 
+        course1_assets, count = self.contentstore.get_all_content_for_course(self.course1_key, include_count=False)
+        self.assertEqual(len(course1_assets), len(self.course1_files), course1_assets)
+        self.assertIsNone(count)
+
         fake_course = CourseLocator('test', 'fake', 'non')
         course_assets, count = self.contentstore.get_all_content_for_course(fake_course)
         self.assertEqual(count, 0)